@@ -5,6 +5,7 @@ import os
 # Directories for graphics, music and levels
 DIRNAME = os.path.abspath(os.path.dirname(__file__))
 LEVEL_DIRECTORY = os.path.join(DIRNAME, "levels")
+LEVEL_PACK = os.path.join(LEVEL_DIRECTORY, "levels.pack")
 GRAPHICS_DIRECTORY = os.path.join(DIRNAME, "graphics")
 GENERAL_DIRECTORY = os.path.join(GRAPHICS_DIRECTORY, "general")
 MUSIC_DIRECTORY = os.path.join(DIRNAME, "music")
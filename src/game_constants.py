@@ -47,6 +47,8 @@ MENU_ENTRIES = {0: "play", 1: "password", 2: "highscores", 3: "lives", 4: "time"
 # User interaction values
 FRAMERATE = 60
 STABILIZING_FRAMERATE = 4
+# Solver values
+SOLVER_MAX_STATES = 200000
 # Colors
 BACKGROUND_COLOR = (0x15, 0x0D, 0x09)
 WHITE = (255, 255, 255)
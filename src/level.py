@@ -4,6 +4,7 @@
 import random
 import numpy as np
 from game_constants import FIELD_X, FIELD_Y, DEFAULT_BACKGROUND_PERCENTAGE
+from level_engine import gravity_step, explode
 
 
 class Level:
@@ -11,9 +12,12 @@ class Level:
         """
         Creates a new level object by loading the starting layout from a file and storing it as the internal field.
         If the shape does not match the expected dimensions, an exception is raised.
-        :param file: The file to load the level data from
+        :param file: The file to load the level data from, or an array holding the level data
         """
-        self._field = np.genfromtxt(file)
+        if isinstance(file, np.ndarray):
+            self._field = file.astype(float)
+        else:
+            self._field = np.genfromtxt(file)
         self._stable = False
         self._score = 0
         if not self.field.shape == (FIELD_Y, FIELD_X):
@@ -74,31 +78,28 @@ class Level:
         """
         if self._stable:
             return True
-        falling = False
-        for y in range(FIELD_Y - 2, -1, -1):
-            for x in range(0, FIELD_X):
-                if (0 < self._field[y][x] < 100) and (self._field[y+1][x] == 0):
-                    falling = True
-                    self._field[y + 1][x] = self._field[y][x]
-                    self._field[y][x] = 0
-        if falling:
+        if gravity_step(self._field).any():
             return False
-        exploding = False
-        for x in range(0, FIELD_X):
-            for y in range(0, FIELD_Y):
-                if (0 < self._field[y][x] < 100) and has_matching_neighbour(self._field, (x, y)):
-                    exploding = True
-                    self._field[y][x] = -1 * abs(self._field[y][x])
-        blocks_removed = np.count_nonzero(self._field < 0)
+        blocks_removed = explode(self._field)
         if blocks_removed > 0:
             self._movable = self._movable - blocks_removed
             self._score = self._score + get_score(blocks_removed)
-            self._field[self._field < 0] = 0
-        if exploding:
             return False
         self._stable = True
         return True
 
+    def copy(self):
+        """
+        Creates an independent copy of this level, including the current field, score and stability state
+        :return: the new Level object
+        """
+        clone = Level.__new__(Level)
+        clone._field = self._field.copy()
+        clone._stable = self._stable
+        clone._score = self._score
+        clone._movable = self._movable
+        return clone
+
     def add_score(self, points):
         """
         Used to count up the points achieved so far
@@ -0,0 +1,118 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import numpy as np
+from level_engine import movable_mask, gravity_step, explode
+
+
+class LevelBatch:
+    def __init__(self, level, count):
+        """
+        Creates a batch of identical boards from a level, stored as one array of shape (count, height, width).
+        All boards follow the same rules as Level, but moves and stabilizing steps are applied to all at once.
+        :param level: the level to copy the starting field and score from
+        :param count: number of boards in the batch
+        """
+        self._fields = np.repeat(level.field[np.newaxis], count, axis=0)
+        self._scores = np.full(count, level.score, dtype=np.int64)
+        self._movable = np.count_nonzero(movable_mask(self._fields), axis=(1, 2))
+        self._stable = np.zeros(count, dtype=bool)
+        self.settle()
+
+    @property
+    def fields(self):
+        return self._fields
+
+    @property
+    def scores(self):
+        return self._scores
+
+    @property
+    def solved(self):
+        return self._movable == 0
+
+    @property
+    def stable(self):
+        return self._stable
+
+    def __len__(self):
+        return len(self._fields)
+
+    def move(self, positions, directions):
+        """
+        Moves one block on every board to the left or right, following the same rules as Level.move.
+        Boards that are not stable or where the move is not allowed stay unchanged.
+        :param positions: array of shape (count, 2) holding the x and y coordinates of the block to move per board
+        :param directions: array of shape (count,) holding -1 to move left or +1 to move right per board
+        :return: boolean array marking the boards on which the block was moved
+        """
+        positions = np.asarray(positions)
+        directions = np.asarray(directions)
+        height, width = self._fields.shape[1:]
+        x = positions[:, 0]
+        y = positions[:, 1]
+        target_x = x + directions
+        moved = self._stable & ((directions == -1) | (directions == 1))
+        moved &= (x >= 0) & (x < width) & (y >= 0) & (y < height) & (target_x >= 0) & (target_x < width)
+        boards = np.flatnonzero(moved)
+        x = x[boards]
+        y = y[boards]
+        target_x = target_x[boards]
+        source = self._fields[boards, y, x]
+        allowed = (source > 0) & (source < 100) & (self._fields[boards, y, target_x] == 0)
+        boards = boards[allowed]
+        self._fields[boards, y[allowed], target_x[allowed]] = source[allowed]
+        self._fields[boards, y[allowed], x[allowed]] = 0
+        self._stable[boards] = False
+        moved[:] = False
+        moved[boards] = True
+        return moved
+
+    def stabilize(self):
+        """
+        Makes one step towards a stable situation on every board, like Level.stabilize:
+        boards with falling blocks let them fall one row, all other boards remove matching blocks.
+        :return: True if all boards are stable, False if anything changed
+        """
+        falling = gravity_step(self._fields).any(axis=(1, 2))
+        resting = np.flatnonzero(~falling & ~self._stable)
+        removed = np.zeros(len(self._fields), dtype=np.int64)
+        if len(resting) > 0:
+            fields = self._fields[resting]
+            removed[resting] = explode(fields)
+            self._fields[resting] = fields
+        self._movable = self._movable - removed
+        self._scores = self._scores + get_scores(removed)
+        self._stable = self._stable | (~falling & (removed == 0))
+        return bool(self._stable.all())
+
+    def settle(self):
+        """
+        Runs stabilizing steps until every board is stable
+        :return: the number of steps it took
+        """
+        steps = 0
+        while not self.stabilize():
+            steps = steps + 1
+        return steps
+
+    def play(self, positions, directions):
+        """
+        Applies one move per board and lets all boards settle afterwards
+        :param positions: array of shape (count, 2) with the block coordinates per board
+        :param directions: array of shape (count,) with -1 or +1 per board
+        :return: boolean array marking the boards on which the block was moved
+        """
+        moved = self.move(positions, directions)
+        self.settle()
+        return moved
+
+
+def get_scores(blocks_removed):
+    """
+    Vectorized version of level.get_score, returning 0 where no blocks were removed
+    :param blocks_removed: array holding how many blocks were removed per board
+    :return: array with the number of points per board
+    """
+    return np.select([blocks_removed == 0, blocks_removed == 2, blocks_removed == 3],
+                     [0, 20, 40], blocks_removed * 15)
@@ -0,0 +1,76 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import numpy as np
+
+# The functions in here work on whole boards at once. They operate on the last two axes of the given array,
+# so a single field of shape (y, x) and a stack of fields of shape (n, y, x) are handled the same way.
+
+
+def movable_mask(field):
+    """
+    Marks all cells containing a movable block
+    :param field: the field (or stack of fields) to check
+    :return: boolean array of the same shape, True where a movable block is
+    """
+    return (field > 0) & (field < 100)
+
+
+def falling_mask(field):
+    """
+    Marks all blocks that fall down one row in the next gravity step.
+    A movable block falls if the first cell below it that is not a movable block is empty,
+    so whole stacks of blocks resting on an empty cell fall together.
+    :param field: the field (or stack of fields) to check
+    :return: boolean array of the same shape, True where a block is falling
+    """
+    movable = movable_mask(field)
+    falling = np.zeros(field.shape, dtype=bool)
+    falling[..., :-1, :] = movable[..., :-1, :] & (field[..., 1:, :] == 0)
+    # blocks resting on falling blocks fall as well, so grow the mask upwards until nothing changes
+    while True:
+        resting = movable[..., :-1, :] & falling[..., 1:, :] & ~falling[..., :-1, :]
+        if not resting.any():
+            return falling
+        falling[..., :-1, :] |= resting
+
+
+def match_mask(field):
+    """
+    Marks all movable blocks that are next to a matching block (above, below, left or right)
+    :param field: the field (or stack of fields) to check
+    :return: boolean array of the same shape, True where a block is about to explode
+    """
+    matches = np.zeros(field.shape, dtype=bool)
+    vertical = field[..., 1:, :] == field[..., :-1, :]
+    matches[..., 1:, :] |= vertical
+    matches[..., :-1, :] |= vertical
+    horizontal = field[..., :, 1:] == field[..., :, :-1]
+    matches[..., :, 1:] |= horizontal
+    matches[..., :, :-1] |= horizontal
+    return matches & movable_mask(field)
+
+
+def gravity_step(field):
+    """
+    Lets all falling blocks move down one row. The field is changed in place.
+    :param field: the field (or stack of fields) to update
+    :return: boolean array marking the blocks that were falling before the step
+    """
+    falling = falling_mask(field)
+    if falling.any():
+        values = np.where(falling, field, 0)
+        field[falling] = 0
+        field[..., 1:, :] = np.where(falling[..., :-1, :], values[..., :-1, :], field[..., 1:, :])
+    return falling
+
+
+def explode(field):
+    """
+    Removes all movable blocks next to a matching block. The field is changed in place.
+    :param field: the field (or stack of fields) to update
+    :return: the number of removed blocks (an array with one entry per field for stacks of fields)
+    """
+    matches = match_mask(field)
+    field[matches] = 0
+    return np.count_nonzero(matches, axis=(-2, -1))
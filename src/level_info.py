@@ -9,20 +9,22 @@ class LevelInfo:
         """
         Loads the level overview from a file an fills various dictionaries to translate between ids, passwords and names
         The level progress is tracked in here, along with scores
-        :param file: the file to load the level information from
+        :param file: the file to load the level information from, or a LevelPack holding the level information
         """
         self._byPassword = {}
         self._byIndex = {}
         self._passwords = {}
         self._times = {}
-        with open(file) as f:
-            self._index = 0
-            for line in f.readlines():
-                line = line.strip().split(',')
-                self._passwords[int(line[0])] = line[1]
-                self._byPassword[line[1]] = int(line[0])
-                self._byIndex[int(line[0])] = line[2]
-                self._times[int(line[0])] = int(line[3])
+        self._index = 0
+        if hasattr(file, "records"):
+            records = file.records()
+        else:
+            records = read_records(file)
+        for index, password, name, time in records:
+            self._passwords[index] = password
+            self._byPassword[password] = index
+            self._byIndex[index] = name
+            self._times[index] = time
         self._totalScore = 0
         self._timeScore = 0
         self._lastScore = 0
@@ -126,3 +128,32 @@ class LevelInfo:
     @property
     def last(self):
         return max(self._byIndex.keys())
+
+    def levels(self):
+        """
+        Lists all levels in the order they are played
+        :return: list of (index, level name) tuples
+        """
+        return sorted(self._byIndex.items())
+
+    def records(self):
+        """
+        Lists the information about all levels in the order they are played
+        :return: list of (index, password, name, time) tuples
+        """
+        return [(index, self._passwords[index], self._byIndex[index], self._times[index])
+                for index in sorted(self._byIndex.keys())]
+
+
+def read_records(file):
+    """
+    Reads the level overview from a text file with one comma separated line of index, password, name and time per level
+    :param file: the file to read
+    :return: list of (index, password, name, time) tuples
+    """
+    records = []
+    with open(file) as f:
+        for line in f.readlines():
+            line = line.strip().split(',')
+            records.append((int(line[0]), line[1], line[2], int(line[3])))
+    return records
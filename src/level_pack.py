@@ -0,0 +1,162 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import argparse
+import mmap
+import os
+import struct
+import sys
+import numpy as np
+from level import Level
+from level_info import LevelInfo
+
+# Binary level pack layout (little endian):
+#   header:  magic, number of levels, field height, field width
+#   records: per level its index, time, password length and name length, followed by password and name (utf-8)
+#   fields:  one uint8 array of height * width cells per level, in record order
+PACK_MAGIC = b"CPYNPACK"
+HEADER = struct.Struct("<8sIHH")
+RECORD = struct.Struct("<IHBB")
+
+
+class LevelPack:
+    def __init__(self, file):
+        """
+        Opens a binary level pack. The file is memory mapped, only the small record table is parsed up front,
+        the fields are read directly from the mapping when requested.
+        :param file: the pack file to open
+        """
+        with open(file, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count, height, width = HEADER.unpack_from(self._map, 0)
+        if magic != PACK_MAGIC:
+            raise ValueError("Not a level pack: " + str(file))
+        self._shape = (height, width)
+        self._records = []
+        self._byName = {}
+        self._byIndex = {}
+        offset = HEADER.size
+        for position in range(count):
+            index, time, password_length, name_length = RECORD.unpack_from(self._map, offset)
+            offset = offset + RECORD.size
+            password = self._map[offset:offset + password_length].decode("utf-8")
+            offset = offset + password_length
+            name = self._map[offset:offset + name_length].decode("utf-8")
+            offset = offset + name_length
+            self._records.append((index, password, name, time))
+            self._byName[name] = position
+            self._byIndex[index] = position
+        self._fields = np.frombuffer(self._map, dtype=np.uint8, count=count * height * width, offset=offset)
+        self._fields = self._fields.reshape((count, height, width))
+
+    def __len__(self):
+        return len(self._records)
+
+    def __contains__(self, name):
+        return name in self._byName
+
+    def __getitem__(self, index):
+        """
+        Reads the field of a level without copying it
+        :param index: the level number as used in the level list
+        :return: read only uint8 array view into the pack
+        """
+        return self._fields[self._byIndex[index]]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def shape(self):
+        return self._shape
+
+    def records(self):
+        """
+        Lists the level metadata stored in the pack
+        :return: list of (index, password, name, time) tuples in level order
+        """
+        return list(self._records)
+
+    def field(self, name):
+        """
+        Reads the field of a level by its name without copying it
+        :param name: the level name as used in the level list
+        :return: read only uint8 array view into the pack
+        """
+        return self._fields[self._byName[name]]
+
+    def level(self, name):
+        """
+        Creates a Level object for a level in the pack
+        :param name: the level name as used in the level list
+        :return: the new Level object
+        """
+        return Level(self.field(name))
+
+    def close(self):
+        """
+        Releases the memory mapping, it is unmapped as soon as no field read from the pack is in use anymore
+        :return: None
+        """
+        self._fields = None
+        self._map = None
+
+
+def is_pack(file):
+    """
+    Checks whether a file is a binary level pack
+    :param file: the file to check
+    :return: True if the file starts with the pack magic bytes
+    """
+    with open(file, "rb") as f:
+        return f.read(len(PACK_MAGIC)) == PACK_MAGIC
+
+
+def write_pack(list_file, pack_file):
+    """
+    Converts a level list and the text level files it names into a binary level pack.
+    Every level is loaded and validated through Level before being written.
+    :param list_file: the level list file, the level files are expected next to it
+    :param pack_file: the pack file to write
+    :return: number of levels written
+    """
+    directory = os.path.dirname(os.path.abspath(list_file))
+    records = LevelInfo(list_file).records()
+    fields = [Level(os.path.join(directory, name)).field for index, password, name, time in records]
+    shapes = set(field.shape for field in fields)
+    if len(shapes) > 1:
+        raise ValueError("All levels in a pack need the same dimensions")
+    height, width = shapes.pop() if shapes else (0, 0)
+    with open(pack_file, "wb") as file:
+        file.write(HEADER.pack(PACK_MAGIC, len(records), height, width))
+        for index, password, name, time in records:
+            password = password.encode("utf-8")
+            name = name.encode("utf-8")
+            file.write(RECORD.pack(index, time, len(password), len(name)))
+            file.write(password)
+            file.write(name)
+        for field in fields:
+            file.write(field.astype(np.uint8).tobytes())
+    return len(records)
+
+
+def main(arguments=None):
+    """
+    Command line entry point converting a text level list into a binary level pack
+    :param arguments: list of command line arguments, sys.argv is used if None
+    :return: 0 on success
+    """
+    parser = argparse.ArgumentParser(description="Converts a level list and its level files into a binary pack.")
+    parser.add_argument("list", help="level list file, the level files are expected next to it")
+    parser.add_argument("pack", help="pack file to write")
+    args = parser.parse_args(arguments)
+    count = write_pack(args.list, args.pack)
+    print("Wrote " + str(count) + " levels to " + args.pack)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
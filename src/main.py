@@ -6,6 +6,7 @@ import random
 import time
 from level import Level
 from level_info import LevelInfo
+from level_pack import LevelPack
 from ui_manager import *
 import directories
 from game_constants import *
@@ -93,7 +94,11 @@ def play_game(ui, pw_entry):
     :return: None
     """
     stop_music()
-    info = LevelInfo(os.path.join(directories.LEVEL_DIRECTORY, "list"))
+    pack = open_level_pack()
+    if pack is not None:
+        info = LevelInfo(pack)
+    else:
+        info = LevelInfo(os.path.join(directories.LEVEL_DIRECTORY, "list"))
     if pw_entry:
         password = ui.show_password_screen()
         info.by_password(password)
@@ -250,12 +255,29 @@ def save_highscores(highscores):
 
 def load_level(name):
     """
-    Loads a level from a file
+    Loads a level from the binary level pack, or from its text file if there is no pack containing it
     :param name: the name of the level file in the levels directory
     :return: The Level object constructed from the file content
     """
+    pack = open_level_pack()
+    if pack is not None and name in pack:
+        return pack.level(name)
     return Level(os.path.join(directories.LEVEL_DIRECTORY, name))
 
 
+_level_pack = None
+
+
+def open_level_pack():
+    """
+    Opens the binary level pack in the levels directory, if there is one. The pack is only opened once and kept open.
+    :return: the LevelPack object or None if the levels are only available as text files
+    """
+    global _level_pack
+    if _level_pack is None and os.path.exists(directories.LEVEL_PACK):
+        _level_pack = LevelPack(directories.LEVEL_PACK)
+    return _level_pack
+
+
 if __name__ == "__main__":
     main()
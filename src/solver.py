@@ -0,0 +1,192 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import hashlib
+from collections import deque
+import numpy as np
+from level_engine import movable_mask
+from game_constants import SOLVER_MAX_STATES
+
+
+class Solution:
+    def __init__(self, moves, score, expanded, complete):
+        """
+        Holds the result of a solver run
+        :param moves: list of (position, direction) moves solving the level, None if no solution was found
+        :param score: the score achieved when playing the moves
+        :param expanded: how many board states were expanded during the search
+        :param complete: False if the search was stopped by the state limit before it could finish
+        """
+        self._moves = moves
+        self._score = score
+        self._expanded = expanded
+        self._complete = complete
+
+    @property
+    def moves(self):
+        return self._moves
+
+    @property
+    def score(self):
+        return self._score
+
+    @property
+    def expanded(self):
+        return self._expanded
+
+    @property
+    def complete(self):
+        return self._complete
+
+    @property
+    def solvable(self):
+        return self._moves is not None
+
+
+def solve(level, max_states=SOLVER_MAX_STATES):
+    """
+    Searches the shortest sequence of moves clearing a level using a breadth first search over stable board states.
+    Every board state is only expanded once, visited states are kept in a transposition table keyed by board hash.
+    States that can never be cleared are pruned.
+    :param level: the level to solve, it is not changed
+    :param max_states: maximum number of board states to keep in the transposition table
+    :return: Solution object with the optimal moves (or None if there are none) and search statistics
+    """
+    start = level.copy()
+    settle(start)
+    if start.solved:
+        return Solution([], start.score, 0, True)
+    start_key = board_key(start.field)
+    table = {start_key: None}
+    queue = deque([(start_key, start)])
+    expanded = 0
+    while queue:
+        key, current = queue.popleft()
+        expanded = expanded + 1
+        for position, direction in possible_moves(current.field):
+            child = current.copy()
+            child.move(position, direction)
+            settle(child)
+            child_key = board_key(child.field)
+            if child_key in table:
+                continue
+            table[child_key] = (key, (position, direction))
+            if child.solved:
+                return Solution(get_moves(table, child_key), child.score, expanded, True)
+            if not is_dead(child.field):
+                queue.append((child_key, child))
+            if len(table) >= max_states:
+                return Solution(None, 0, expanded, False)
+    return Solution(None, 0, expanded, True)
+
+
+def best_score(level, max_states=SOLVER_MAX_STATES):
+    """
+    Searches the highest score that can be reached when clearing a level.
+    Scores only grow when blocks are removed, so every board state keeps the best score it was reached with and is
+    expanded again whenever a better score for it is found. States that can never be cleared are pruned.
+    :param level: the level to search, it is not changed
+    :param max_states: maximum number of board states to keep in the transposition table
+    :return: Solution object with the moves reaching the best score (or None if unsolvable) and search statistics,
+    if the state limit is reached the best score found so far is returned
+    """
+    start = level.copy()
+    settle(start)
+    if start.solved:
+        return Solution([], start.score, 0, True)
+    start_key = board_key(start.field)
+    table = {start_key: (start.score, None)}
+    queue = deque([(start_key, start)])
+    best = None
+    expanded = 0
+    while queue:
+        key, current = queue.popleft()
+        if current.score < table[key][0]:
+            continue
+        expanded = expanded + 1
+        for position, direction in possible_moves(current.field):
+            child = current.copy()
+            child.move(position, direction)
+            settle(child)
+            child_key = board_key(child.field)
+            if child_key in table and table[child_key][0] >= child.score:
+                continue
+            table[child_key] = (child.score, (key, (position, direction)))
+            if child.solved:
+                if best is None or child.score > table[best][0]:
+                    best = child_key
+            elif not is_dead(child.field):
+                queue.append((child_key, child))
+            if len(table) >= max_states:
+                queue.clear()
+                break
+    complete = len(table) < max_states
+    if best is None:
+        return Solution(None, 0, expanded, complete)
+    moves = []
+    key = best
+    while table[key][1] is not None:
+        key, move = table[key][1]
+        moves.append(move)
+    moves.reverse()
+    return Solution(moves, table[best][0], expanded, complete)
+
+
+def settle(level):
+    """
+    Runs stabilizing steps on a level until it is stable
+    :param level: the level to stabilize
+    :return: None
+    """
+    while not level.stabilize():
+        pass
+
+
+def possible_moves(field):
+    """
+    Lists all moves changing the field, which are movable blocks with an empty cell to the left or right
+    :param field: the field to check
+    :return: list of (position, direction) tuples as accepted by Level.move
+    """
+    movable = movable_mask(field)
+    empty = field == 0
+    moves = []
+    for y, x in np.argwhere(movable[:, 1:] & empty[:, :-1]):
+        moves.append(((int(x) + 1, int(y)), -1))
+    for y, x in np.argwhere(movable[:, :-1] & empty[:, 1:]):
+        moves.append(((int(x), int(y)), 1))
+    return moves
+
+
+def is_dead(field):
+    """
+    Checks whether a field can never be cleared, which is the case if a block type has only one block left
+    :param field: the field to check
+    :return: True if the field can not be solved anymore
+    """
+    counts = np.bincount(field[movable_mask(field)].astype(np.int64))
+    return bool(np.any(counts == 1))
+
+
+def board_key(field):
+    """
+    Hashes a field into a compact key for the transposition table
+    :param field: the field to hash
+    :return: 8 byte digest of the field content
+    """
+    return hashlib.blake2b(field.tobytes(), digest_size=8).digest()
+
+
+def get_moves(table, key):
+    """
+    Follows the parent links in the transposition table back to the start state
+    :param table: the transposition table mapping keys to (parent key, move) or None for the start state
+    :param key: key of the state to reconstruct the move sequence for
+    :return: list of moves leading from the start state to the given state
+    """
+    moves = []
+    while table[key] is not None:
+        key, move = table[key]
+        moves.append(move)
+    moves.reverse()
+    return moves
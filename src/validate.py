@@ -0,0 +1,123 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from level import Level
+from level_info import LevelInfo
+import directories
+import solver
+from game_constants import SOLVER_MAX_STATES
+
+
+def main(arguments=None):
+    """
+    Command line entry point, validates all levels of a level list in parallel and writes a summary
+    :param arguments: list of command line arguments, sys.argv is used if None
+    :return: 0 if all levels are valid, 1 otherwise
+    """
+    parser = argparse.ArgumentParser(description="Checks that all levels of a level list are valid and solvable.")
+    parser.add_argument("list", nargs="?", default=os.path.join(directories.LEVEL_DIRECTORY, "list"),
+                        help="level list file, the level files are expected next to it")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count(),
+                        help="number of worker processes")
+    parser.add_argument("-m", "--max-states", type=int, default=SOLVER_MAX_STATES,
+                        help="maximum number of board states per search")
+    parser.add_argument("-o", "--output", default="validation.json",
+                        help="file to write the machine readable summary to")
+    args = parser.parse_args(arguments)
+    start = time.time()
+    results = validate_pack(args.list, args.workers, args.max_states)
+    for result in results:
+        print(format_result(result))
+    summary = {"list": os.path.abspath(args.list),
+               "workers": args.workers,
+               "max_states": args.max_states,
+               "time": time.time() - start,
+               "valid": all(result["valid"] for result in results),
+               "levels": results}
+    with open(args.output, "w") as file:
+        json.dump(summary, file, indent=2)
+    print("Checked " + str(len(results)) + " levels in " + "%.2f" % summary["time"] + "s, summary written to "
+          + args.output)
+    return 0 if summary["valid"] else 1
+
+
+def validate_pack(list_file, workers, max_states=SOLVER_MAX_STATES):
+    """
+    Validates all levels named in a level list using a pool of worker processes
+    :param list_file: the level list file as read by LevelInfo
+    :param workers: number of worker processes
+    :param max_states: maximum number of board states per search
+    :return: list of result dictionaries (see validate_level) in level order
+    """
+    directory = os.path.dirname(os.path.abspath(list_file))
+    jobs = [(index, os.path.join(directory, name), max_states) for index, name in LevelInfo(list_file).levels()]
+    with multiprocessing.Pool(max(1, workers)) as pool:
+        return pool.starmap(validate_level, jobs, chunksize=1)
+
+
+def validate_level(index, path, max_states=SOLVER_MAX_STATES):
+    """
+    Validates a single level file. The level needs to have the correct shape, be stable at the start and be solvable.
+    :param index: the level number
+    :param path: path of the level file
+    :param max_states: maximum number of board states per search
+    :return: dictionary describing the result, including timing, solution length and best possible score
+    """
+    start = time.time()
+    result = {"index": index,
+              "name": os.path.basename(path),
+              "valid": False,
+              "error": None,
+              "moves": None,
+              "solution": None,
+              "best_score": None,
+              "expanded": 0,
+              "complete": True}
+    try:
+        level = Level(path)
+    except (OSError, ValueError) as error:
+        result["error"] = str(error)
+        result["time"] = time.time() - start
+        return result
+    shortest = solver.solve(level, max_states)
+    result["expanded"] = shortest.expanded
+    result["complete"] = shortest.complete
+    if shortest.solvable:
+        best = solver.best_score(level, max_states)
+        result["valid"] = True
+        result["moves"] = len(shortest.moves)
+        result["solution"] = [[position[0], position[1], direction] for position, direction in shortest.moves]
+        result["best_score"] = int(best.score)
+        result["best_score_complete"] = best.complete
+        result["expanded"] = result["expanded"] + best.expanded
+    elif shortest.complete:
+        result["error"] = "Level can not be solved"
+    else:
+        result["error"] = "No solution found within " + str(max_states) + " states"
+    result["time"] = time.time() - start
+    return result
+
+
+def format_result(result):
+    """
+    Formats a validation result as one line of text for the console report
+    :param result: result dictionary from validate_level
+    :return: the text line
+    """
+    line = "%3d %-16s %7.2fs " % (result["index"], result["name"], result["time"])
+    if not result["valid"]:
+        return line + "INVALID: " + result["error"]
+    line = line + "%3d moves, best score %5d" % (result["moves"], result["best_score"])
+    if not result["best_score_complete"]:
+        line = line + " (search incomplete)"
+    return line
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+import os
+import random
+import numpy
+import pytest
+import level
+import level_batch
+import solver
+from directories import LEVEL_DIRECTORY
+
+
+def test_create():
+    lvl = level.Level(os.path.join(LEVEL_DIRECTORY, "level_01"))
+    batch = level_batch.LevelBatch(lvl, 5)
+    assert len(batch) == 5
+    assert batch.fields.shape == (5, level.FIELD_Y, level.FIELD_X)
+    assert batch.stable.all()
+    assert not batch.solved.any()
+    assert (batch.scores == 0).all()
+
+
+def test_scores():
+    removed = numpy.array([0, 2, 3, 4, 7])
+    expected = [0] + [level.get_score(n) for n in removed[1:]]
+    assert list(level_batch.get_scores(removed)) == expected
+
+
+def test_invalid_moves():
+    lvl = level.Level(os.path.join(LEVEL_DIRECTORY, "level_01"))
+    batch = level_batch.LevelBatch(lvl, 4)
+    moved = batch.play([(0, 0), (6, 4), (6, 4), (-1, 20)], [-1, -2, 1, 1])
+    assert not moved.any()
+    assert batch.stable.all()
+
+
+@pytest.mark.parametrize("name", ["level_01", "level_05", "level_09", "level_12", "level_16"])
+def test_matches_level(name):
+    rng = random.Random(name)
+    lvl = level.Level(os.path.join(LEVEL_DIRECTORY, name))
+    count = 16
+    batch = level_batch.LevelBatch(lvl, count)
+    levels = [lvl.copy() for _ in range(count)]
+    for _ in range(40):
+        positions = []
+        directions = []
+        for single in levels:
+            moves = solver.possible_moves(single.field)
+            if moves and rng.random() < 0.9:
+                position, direction = rng.choice(moves)
+            else:
+                position, direction = (rng.randrange(level.FIELD_X), rng.randrange(level.FIELD_Y)), rng.choice((-1, 1))
+            positions.append(position)
+            directions.append(direction)
+        moved = batch.play(positions, directions)
+        for i, single in enumerate(levels):
+            assert moved[i] == single.move(positions[i], directions[i])
+            solver.settle(single)
+            assert numpy.array_equal(batch.fields[i], single.field)
+            assert batch.scores[i] == single.score
+            assert batch.solved[i] == single.solved
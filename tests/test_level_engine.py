@@ -0,0 +1,129 @@
+import os
+import random
+import numpy
+import pytest
+import level
+import level_engine
+from directories import LEVEL_DIRECTORY
+
+LEVELS = ["level_%02d" % i for i in range(1, 17)]
+
+
+def reference_stabilize(field):
+    """
+    The original cell by cell implementation of Level.stabilize, used to check the vectorized engine against.
+    :return: (stable, number of removed blocks)
+    """
+    falling = False
+    for y in range(field.shape[0] - 2, -1, -1):
+        for x in range(0, field.shape[1]):
+            if (0 < field[y][x] < 100) and (field[y + 1][x] == 0):
+                falling = True
+                field[y + 1][x] = field[y][x]
+                field[y][x] = 0
+    if falling:
+        return False, 0
+    for x in range(0, field.shape[1]):
+        for y in range(0, field.shape[0]):
+            if (0 < field[y][x] < 100) and level.has_matching_neighbour(field, (x, y)):
+                field[y][x] = -1 * abs(field[y][x])
+    blocks_removed = numpy.count_nonzero(field < 0)
+    field[field < 0] = 0
+    return blocks_removed == 0, blocks_removed
+
+
+def random_field(rng, colors, fill):
+    field = numpy.zeros((level.FIELD_Y, level.FIELD_X))
+    for y in range(level.FIELD_Y):
+        for x in range(level.FIELD_X):
+            roll = rng.random()
+            if roll < fill:
+                field[y][x] = rng.randint(1, colors)
+            elif roll < fill + 0.15:
+                field[y][x] = rng.randint(100, 117)
+    return field
+
+
+def assert_same_steps(field):
+    expected = field.copy()
+    actual = field.copy()
+    for _ in range(100):
+        stable, removed = reference_stabilize(expected)
+        falling = level_engine.gravity_step(actual)
+        actual_removed = 0 if falling.any() else level_engine.explode(actual)
+        assert numpy.array_equal(expected, actual)
+        assert removed == actual_removed
+        if stable:
+            assert not falling.any() and actual_removed == 0
+            return
+    pytest.fail("field did not stabilize")
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_random_fields(seed):
+    rng = random.Random(seed)
+    assert_same_steps(random_field(rng, rng.randint(1, 6), rng.uniform(0.1, 0.8)))
+
+
+def test_tall_stack():
+    field = numpy.zeros((level.FIELD_Y, level.FIELD_X))
+    field[0:level.FIELD_Y - 1, 3] = [1, 2, 3, 1, 2, 3, 1, 2, 3]
+    field[level.FIELD_Y - 1, 3] = 0
+    falling = level_engine.falling_mask(field)
+    assert numpy.array_equal(falling[:, 3], field[:, 3] > 0)
+    assert_same_steps(field)
+
+
+def test_blocks_rest_on_walls():
+    field = numpy.zeros((3, 3))
+    field[0][1] = 1
+    field[1][1] = 100
+    assert not level_engine.falling_mask(field).any()
+    field[2][0] = 2
+    field[1][0] = 3
+    assert not level_engine.falling_mask(field).any()
+
+
+def test_match_mask():
+    field = numpy.array([[1, 1, 0], [0, 2, 100], [0, 3, 100]])
+    assert numpy.array_equal(level_engine.match_mask(field), [[True, True, False],
+                                                              [False, False, False],
+                                                              [False, False, False]])
+
+
+def test_stack_of_fields():
+    rng = random.Random(77)
+    fields = numpy.array([random_field(rng, 4, 0.5) for _ in range(8)])
+    single = fields.copy()
+    falling = level_engine.gravity_step(fields)
+    for i in range(len(single)):
+        assert numpy.array_equal(falling[i], level_engine.gravity_step(single[i]))
+        assert numpy.array_equal(fields[i], single[i])
+    removed = level_engine.explode(fields)
+    for i in range(len(single)):
+        assert removed[i] == level_engine.explode(single[i])
+
+
+@pytest.mark.parametrize("name", LEVELS)
+def test_levels_random_play(name):
+    rng = random.Random(name)
+    lvl = level.Level(os.path.join(LEVEL_DIRECTORY, name))
+    field = lvl.field.copy()
+    score = 0
+    for _ in range(30):
+        x = rng.randrange(level.FIELD_X)
+        y = rng.randrange(level.FIELD_Y)
+        direction = rng.choice((-1, 1))
+        if not lvl.move((x, y), direction):
+            continue
+        field[y][x + direction] = field[y][x]
+        field[y][x] = 0
+        while True:
+            stable, removed = reference_stabilize(field)
+            if removed:
+                score = score + level.get_score(removed)
+            assert lvl.stabilize() == stable
+            assert numpy.array_equal(lvl.field, field)
+            if stable:
+                break
+        assert lvl.score == score
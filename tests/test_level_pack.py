@@ -0,0 +1,55 @@
+import os
+import numpy
+import pytest
+import level
+import level_info
+import level_pack
+from directories import LEVEL_DIRECTORY
+
+
+@pytest.fixture
+def pack_file(tmp_path):
+    path = str(tmp_path / "levels.pack")
+    level_pack.write_pack(os.path.join(LEVEL_DIRECTORY, "list"), path)
+    return path
+
+
+def test_roundtrip(pack_file):
+    info = level_info.LevelInfo(os.path.join(LEVEL_DIRECTORY, "list"))
+    with level_pack.LevelPack(pack_file) as pack:
+        assert len(pack) == 16
+        assert pack.shape == (level.FIELD_Y, level.FIELD_X)
+        assert pack.records() == info.records()
+        for index, password, name, time in info.records():
+            text = level.Level(os.path.join(LEVEL_DIRECTORY, name))
+            assert name in pack
+            assert numpy.array_equal(pack[index], text.field)
+            assert numpy.array_equal(pack.level(name).field, text.field)
+
+
+def test_zero_copy(pack_file):
+    with level_pack.LevelPack(pack_file) as pack:
+        field = pack.field("level_01")
+        assert field.dtype == numpy.uint8
+        assert not field.flags.writeable
+        assert not field.flags.owndata
+        lvl = pack.level("level_01")
+        assert lvl.move((6, 4), -1)
+        assert field[4][6] != 0
+
+
+def test_level_info_from_pack(pack_file):
+    with level_pack.LevelPack(pack_file) as pack:
+        info = level_info.LevelInfo(pack)
+        assert info.first() == "level_01"
+        assert info.next == "level_02"
+        assert info.password == "BACARDI"
+        assert info.time == 25
+        assert info.last == 16
+
+
+def test_not_a_pack():
+    path = os.path.join(LEVEL_DIRECTORY, "list")
+    assert not level_pack.is_pack(path)
+    with pytest.raises(ValueError):
+        level_pack.LevelPack(path)
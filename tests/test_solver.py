@@ -0,0 +1,51 @@
+import os
+import numpy
+import level
+import solver
+from directories import LEVEL_DIRECTORY
+
+
+def test_solve_level():
+    lvl = level.Level(os.path.join(LEVEL_DIRECTORY, "level_01"))
+    before = lvl.field.copy()
+    solution = solver.solve(lvl)
+    assert solution.solvable
+    assert solution.complete
+    assert len(solution.moves) == 3
+    assert solution.expanded > 0
+    assert numpy.array_equal(lvl.field, before)
+    for position, direction in solution.moves:
+        assert lvl.move(position, direction)
+        solver.settle(lvl)
+    assert lvl.solved
+    assert lvl.score == solution.score
+
+
+def test_shortest_solution():
+    lvl = level.Level(os.path.join(LEVEL_DIRECTORY, "level_10"))
+    solution = solver.solve(lvl)
+    assert len(solution.moves) == 2
+
+
+def test_unsolvable():
+    lvl = level.Level(os.path.join(LEVEL_DIRECTORY, "level_01"))
+    lvl.field[lvl.field == 3] = 0
+    lvl.field[0][0] = 0
+    lvl.field[0][1] = 3
+    lvl._movable = numpy.count_nonzero((lvl.field > 0) & (lvl.field < 100))
+    assert solver.is_dead(lvl.field)
+    solution = solver.solve(lvl)
+    assert not solution.solvable
+    assert solution.complete
+
+
+def test_state_limit():
+    lvl = level.Level(os.path.join(LEVEL_DIRECTORY, "level_05"))
+    solution = solver.solve(lvl, max_states=10)
+    assert not solution.solvable
+    assert not solution.complete
+
+
+def test_possible_moves():
+    field = numpy.array([[0, 1, 0], [100, 2, 100]])
+    assert sorted(solver.possible_moves(field)) == [((1, 0), -1), ((1, 0), 1)]
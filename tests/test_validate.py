@@ -0,0 +1,37 @@
+import json
+import os
+import shutil
+import validate
+from directories import LEVEL_DIRECTORY
+
+
+def test_validate_level():
+    result = validate.validate_level(1, os.path.join(LEVEL_DIRECTORY, "level_01"))
+    assert result["valid"]
+    assert result["moves"] == 3
+    assert result["best_score"] == 80
+    assert result["time"] >= 0
+
+
+def test_invalid_level():
+    path = os.path.join(os.path.dirname(__file__), "wrong_dimensions")
+    result = validate.validate_level(1, path)
+    assert not result["valid"]
+    assert result["error"]
+    result = validate.validate_level(2, "does_not_exist")
+    assert not result["valid"]
+
+
+def test_validate_pack(tmp_path):
+    shutil.copy(os.path.join(LEVEL_DIRECTORY, "level_01"), tmp_path / "level_01")
+    shutil.copy(os.path.join(os.path.dirname(__file__), "wrong_dimensions"), tmp_path / "level_02")
+    with open(tmp_path / "list", "w") as file:
+        file.write("1,,level_01,25\n2,TEST,level_02,25\n")
+    output = tmp_path / "summary.json"
+    assert validate.main([str(tmp_path / "list"), "--workers", "2", "--output", str(output)]) == 1
+    with open(output) as file:
+        summary = json.load(file)
+    assert not summary["valid"]
+    assert [level["name"] for level in summary["levels"]] == ["level_01", "level_02"]
+    assert summary["levels"][0]["valid"]
+    assert not summary["levels"][1]["valid"]